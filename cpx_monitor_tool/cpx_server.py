@@ -68,6 +68,29 @@ class CPXHandler(SimpleHTTPRequestHandler):
         else:
             self._invalid_endpoint()
 
+    def do_POST(self):
+        if self.path != '/batch-requests':
+            self._invalid_endpoint()
+            return
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            pipeline = json.loads(self.rfile.read(length))['pipeline']
+        except (ValueError, KeyError, TypeError):
+            self._invalid_endpoint()
+            return
+        if not isinstance(pipeline, list) or not all(isinstance(request, dict) for request in pipeline):
+            self._invalid_endpoint()
+            return
+        results = []
+        for request in pipeline:
+            path = request.get('path')
+            ip = path.lstrip('/') if isinstance(path, str) else None
+            if request.get('method') == 'GET' and ip in SERVER_SET:
+                results.append({'status': 200, 'body': _server_stats(ip)})
+            else:
+                results.append({'status': 400, 'body': {'error': 'Invalid IP'}})
+        self._json(results)
+
 
 def main(port: int, protocol: int):
     if protocol == 6 and not socket.has_ipv6:
@@ -1,33 +1,34 @@
 #!/usr/bin/env python3
 
 import argparse
-import json
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
-from collections import defaultdict
-from typing import Dict, List, Tuple
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+from typing import Collection, Dict, List, NamedTuple, Optional, Set, Tuple
 import sys
 from datetime import datetime
-import signal
-from tabulate import tabulate
-from dotenv import load_dotenv
 import os
 import logging
+import tempfile
+import threading
 from logging.handlers import RotatingFileHandler
 
-### CPX Dashboard library imports
-from rich.console import Console
-from rich.table import Table
-from rich.live import Live
-from rich.layout import Layout
-from rich.panel import Panel
-from rich.text import Text
-import time
-
+# rich (dashboard) and tabulate (reports) are imported where they are used so
+# commands that don't need them skip their import cost at startup
 
+# Load environment variables from .env unless already provided by the environment
+if os.getenv('SLACK_WEBHOOK_URL') is None:
+    from dotenv import load_dotenv
+    load_dotenv()
 
-# Load environment variables
-load_dotenv()
+# Read once; the webhook does not change for the lifetime of the process
+SLACK_WEBHOOK_URL = os.getenv('SLACK_WEBHOOK_URL')
 
 # Configure logging
 def setup_logging():
@@ -58,11 +59,177 @@ def setup_logging():
 
 logger = setup_logging()
 
+if not SLACK_WEBHOOK_URL:
+    logger.warning("SLACK_WEBHOOK_URL not found in environment variables, Slack alerts are disabled")
+
+# Upper bound on concurrent stat requests issued by update_all_stats
+MAX_FETCH_WORKERS = 32
+# Keep-alive connections held per host by the CPX API and Slack webhook sessions
+HTTP_POOL_SIZE = 64
+SLACK_POOL_SIZE = 2
+# track_service polls only the tracked IPs, re-scanning the whole fleet every N seconds
+TRACK_FULL_REFRESH_INTERVAL = 60.0
+# track_service polls every MIN seconds while stats change, backing off to MAX when stable
+TRACK_MIN_INTERVAL = 5.0
+TRACK_MAX_INTERVAL = 60.0
+TRACK_BACKOFF = 1.5
+# Unchanged track_service refreshes print a one-line heartbeat at most this often
+TRACK_HEARTBEAT_INTERVAL = 30.0
+# Dashboard polls CPX in the background and re-renders independently of slow polls
+DASHBOARD_POLL_INTERVAL = 5.0
+DASHBOARD_RENDER_INTERVAL = 0.25
+# Seconds a fetched result is served from memory before hitting CPX again
+STATS_CACHE_TTL = 2.0
+SERVERS_CACHE_TTL = 30.0
+# Server list shared between CLI runs, reused while younger than SERVERS_CACHE_TTL
+SERVERS_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'cpx_monitor', 'servers.json')
+# Recent Slack alerts shared between CLI runs, so scheduled flag runs do not re-alert
+ALERTS_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'cpx_monitor', 'alerts.json')
+# Oldest cached stats that may be served when CPX is unreachable
+STATS_STALE_TTL = 30.0
+# Seconds during which a service is not re-alerted at the same healthy instance count
+ALERT_DEDUP_TTL = 300.0
+# Longest a repeatedly failing server is skipped before being polled again
+FAILURE_BACKOFF_MAX = 60.0
+# Headers for requests whose body is pre-encoded with orjson
+JSON_HEADERS = {'Content-Type': 'application/json'}
+# Slack rejects messages over 50 blocks; larger alerts are split across several posts
+SLACK_MAX_BLOCKS = 48
+# Slack rejects section text over 3000 characters; 80 instance rows stay well below it
+SLACK_SECTION_ROWS = 80
+# Services listed per auto-scaling section, keeping names of up to ~50 characters under the limit
+SLACK_SECTION_SERVICES = 50
+# Server status values; every ServerStat shares these objects, so == matches on identity
+HEALTHY = 'Healthy'
+UNHEALTHY = 'Unhealthy'
+
+@dataclass(frozen=True)
+class ServerStat:
+    """Stats for one CPX server, with percentages parsed once at fetch time"""
+    __slots__ = ('ip', 'service', 'status', 'cpu', 'memory', 'cpu_pct', 'mem_pct')
+    ip: str
+    service: str
+    status: str
+    cpu: str
+    memory: str
+    cpu_pct: int
+    mem_pct: int
+
+@dataclass(frozen=True)
+class Snapshot:
+    """Per-service aggregates and alert candidates derived from one stats refresh"""
+    services: Dict[str, Dict[str, int]]
+    service_ips: Dict[str, List[str]]
+    unhealthy: List[ServerStat]
+    underprovisioned: Set[str]
+
+class ServiceRow(NamedTuple):
+    """One instance of an underprovisioned service, as reported by the flag command"""
+    service: str
+    ip: str
+    status: str
+    cpu: str
+    memory: str
+    health_note: str
+    cpu_pct: int
+    mem_pct: int
+
+def _mrkdwn_section(text: str) -> Dict:
+    """Build a Slack section block with mrkdwn text"""
+    return {"type": "section", "text": {"type": "mrkdwn", "text": text}}
+
+def _service_alert_sections(service_name: str, instances: List[ServiceRow]) -> List[Dict]:
+    """Build Slack sections listing a service's unhealthy instances as code-block tables
+
+    Instances are spread over sections of at most SLACK_SECTION_ROWS rows so no
+    section exceeds Slack's per-section text limit.
+    """
+    sections = []
+    for start in range(0, len(instances), SLACK_SECTION_ROWS):
+        title = f"({len(instances)} unhealthy instances)" if start == 0 else "(continued)"
+        sections.append(_mrkdwn_section(
+            f"*{service_name}* {title}\n"
+            f"```{'IP':<15} {'CPU':>5} {'Memory':>7}\n"
+            + "\n".join(f"{row.ip:<15} {row.cpu:>5} {row.memory:>7}"
+                        for row in instances[start:start + SLACK_SECTION_ROWS])
+            + "```"
+        ))
+    return sections
+
+# Static Slack blocks, shared across messages rather than rebuilt per alert
+SLACK_DIVIDER_BLOCK = {"type": "divider"}
+SLACK_ALERT_HEADER_BLOCK = {
+    "type": "header",
+    "text": {
+        "type": "plain_text",
+        "text": "Underprovisioned Unhealthy Services with fewer than 2 healthy instances",
+        "emoji": True
+    }
+}
+SLACK_SCALING_HEADER_BLOCK = {
+    "type": "header",
+    "text": {
+        "type": "plain_text",
+        "text": "Auto-scaling Initiated",
+        "emoji": True
+    }
+}
+SLACK_SCALING_INTRO_BLOCK = _mrkdwn_section("The following services were scaled based on CPU/Memory usage:")
+SLACK_SCALING_CONTEXT_BLOCK = {
+    "type": "context",
+    "elements": [
+        {
+            "type": "mrkdwn",
+            "text": "Trigger: CPU or Memory > 80%"
+        }
+    ]
+}
+
+def _write_atomic(path: str, data: bytes):
+    """Replace path with data via a private temp file, so concurrent runs never read or mix partial writes"""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def _pct(value: str, _int=int) -> int:
+    """Parse a CPX percentage such as "42%" (or a bare "42") into an int
+
+    Raises ValueError for anything else, including an empty string.
+    """
+    # _int is bound as a default so the hot path skips the global lookup;
+    # slicing rather than indexing keeps "" a ValueError instead of an IndexError
+    return _int(value[:-1]) if value[-1:] == '%' else _int(value)
+
 ### CPX Dashboard
 class TerminalDashboard:
     def __init__(self, monitor):
+        from rich.console import Console
+        from rich.layout import Layout
+
         self.monitor = monitor
         self.console = Console()
+        self._stop = threading.Event()
+        self._last_refresh_ok = True
+        # Layout skeleton is built once; each frame only swaps in fresh renderables
+        self.layout = Layout()
+        self.layout.split(
+            Layout(name="header", size=3),
+            Layout(name="body")
+        )
+        self.layout["body"].split_row(
+            Layout(name="stats"),
+            Layout(name="alerts")
+        )
         logger.info("Dashboard initialized")
 
     def _refresh_data(self):
@@ -71,11 +238,13 @@ class TerminalDashboard:
             self.monitor.update_all_stats()
             return True
         except Exception as e:
-            logger.error(f"Data refresh failed: {e}")
+            logger.error("Data refresh failed: %s", e)
             return False
 
     def _create_stats_table(self):
         """Generate service stats table"""
+        from rich.table import Table
+
         table = Table(title="Service Status")
         table.add_column("Service")
         table.add_column("Healthy", justify="right")
@@ -86,15 +255,7 @@ class TerminalDashboard:
             table.add_row("[red]No data available[/]", "", "", "")
             return table
             
-        service_data = defaultdict(lambda: {'healthy': 0, 'cpu': 0, 'memory': 0, 'total': 0})
-        
-        for stats in self.monitor.server_stats.values():
-            service = stats['service']
-            service_data[service]['cpu'] += int(stats['cpu'][:-1])
-            service_data[service]['memory'] += int(stats['memory'][:-1])
-            service_data[service]['total'] += 1
-            if stats['status'] == 'Healthy':
-                service_data[service]['healthy'] += 1
+        service_data = self.monitor.snapshot.services
         
         for service, data in service_data.items():
             healthy_pct = (data['healthy'] / data['total']) * 100
@@ -111,291 +272,596 @@ class TerminalDashboard:
 
     def _create_alerts_panel(self):
         """Generate alerts panel"""
+        from rich.panel import Panel
+
         if not self.monitor.server_stats:
             return Panel("[yellow]Waiting for first data update...[/]", style="yellow")
             
-        alerts = []
-        for ip, stats in self.monitor.server_stats.items():
-            if stats['status'] == 'Unhealthy':
-                alerts.append(
-                    f"[red]• {stats['service']} @ {ip}[/]\n"
-                    f"  CPU: {stats['cpu']} Memory: {stats['memory']}"
-                )
+        alerts = [
+            f"[red]• {stats.service} @ {stats.ip}[/]\n"
+            f"  CPU: {stats.cpu} Memory: {stats.memory}"
+            for stats in self.monitor.snapshot.unhealthy
+        ]
         
         if not alerts:
             return Panel("No active alerts", style="green")
         
         return Panel("\n".join(alerts[:5]), title="Active Alerts", style="red")
 
+    def _last_update_text(self):
+        last_update = self.monitor.last_update
+        return last_update.strftime('%Y-%m-%d %H:%M:%S') if last_update else "pending"
+
     def generate_dashboard(self):
-        """Create complete dashboard layout"""
-        layout = Layout()
-        layout.split(
-            Layout(name="header", size=3),
-            Layout(name="body")
-        )
-        
-        layout["header"].update(
-            Panel(f"[bold]CPX Monitoring[/] | Last update: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        )
-        
-        stats_table = self._create_stats_table()
-        alert_panel = self._create_alerts_panel()
-        
-        layout["body"].split_row(
-            Layout(stats_table, name="stats"),
-            Layout(alert_panel, name="alerts")
+        """Refresh the cached dashboard layout in place and return it"""
+        from rich.panel import Panel
+
+        self.layout["header"].update(
+            Panel(f"[bold]CPX Monitoring[/] | Last update: {self._last_update_text()}")
         )
-        
-        return layout
+        self.layout["stats"].update(self._create_stats_table())
+        self.layout["alerts"].update(self._create_alerts_panel())
+        return self.layout
+
+    def _poll_loop(self):
+        """Refresh monitor data in the background until the dashboard stops"""
+        while not self._stop.is_set():
+            self._last_refresh_ok = self._refresh_data()
+            self._stop.wait(DASHBOARD_POLL_INTERVAL)
 
     def start_live_view(self):
-        """Run interactive dashboard"""
+        """Run interactive dashboard, polling CPX on a background thread"""
+        from rich.live import Live
+        from rich.panel import Panel
+
+        poller = threading.Thread(target=self._poll_loop, name="dashboard-poller", daemon=True)
+        poller.start()
         try:
             with Live(self.generate_dashboard(), refresh_per_second=4, screen=True) as live:
-                while True:
+                while not self._stop.is_set():
                     try:
-                        if not self._refresh_data():
+                        if not self._last_refresh_ok:
                             live.update(Panel("[red]Failed to update data[/]"))
                         else:
                             live.update(self.generate_dashboard())
-                        time.sleep(5)
+                        time.sleep(DASHBOARD_RENDER_INTERVAL)
                     except KeyboardInterrupt:
                         logger.info("Dashboard stopped by user")
                         break
                     except Exception as e:
-                        logger.error(f"Live update error: {e}")
-                        time.sleep(5)
+                        logger.error("Live update error: %s", e)
+                        time.sleep(DASHBOARD_POLL_INTERVAL)
         except Exception as e:
-            logger.critical(f"Dashboard failed: {e}")
+            logger.critical("Dashboard failed: %s", e)
             raise
+        finally:
+            self._stop.set()
+            poller.join(timeout=1)
 
 class CPXMonitor:
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, max_workers: int = MAX_FETCH_WORKERS, use_batch: bool = False,
+                 stats_ttl: float = STATS_CACHE_TTL, servers_cache_path: Optional[str] = None,
+                 refresh_servers: bool = False, alerts_cache_path: Optional[str] = None):
         self.base_url = base_url
+        # On-disk server list lets back-to-back CLI runs skip the /servers call
+        self.servers_cache_path = servers_cache_path
+        # On-disk alert history lets separate flag runs share the dedup window
+        self.alerts_cache_path = alerts_cache_path
+        # Seconds fetched stats are reused; a stale fallback never expires sooner
+        self.stats_ttl = stats_ttl
+        self._stale_ttl = max(STATS_STALE_TTL, stats_ttl)
+        # Batch endpoint is not part of the base CPX API, so it is opt-in
+        self.use_batch = use_batch
         self.servers = []
         self.server_stats = {}
         self.last_update = None
-        logger.info(f"Initializing CPXMonitor with base URL: {base_url}")
+        self._stats_cache: Dict[str, Tuple[float, ServerStat]] = {}
+        self._servers_fetched_at: Optional[float] = None
+        # Hit/miss counters per cache, updated from the fetch worker threads
+        self._cache_counts = Counter()
+        self._cache_counts_lock = threading.Lock()
+        # Wall-clock time each (service, healthy instance count) was last alerted on Slack;
+        # keys are reserved when an alert is queued and released again if delivery fails
+        self._recent_alerts: Dict[Tuple[str, int], float] = self._load_recent_alerts()
+        self._recent_alerts_lock = threading.Lock()
+        # Consecutive failures and earliest retry time per IP
+        self._fail_counts: Dict[str, int] = {}
+        self._next_try: Dict[str, float] = {}
+        self._snapshot: Optional[Tuple[Dict, Snapshot]] = None
+        # Shared pool so repeated refreshes (track/dashboard) reuse worker threads
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.session = self._create_session(max(HTTP_POOL_SIZE, max_workers))
+        self.session.headers['Accept'] = 'application/json'
+        # Slack gets its own small pool so alerts never queue behind stat fetches
+        self.slack_session = self._create_session(SLACK_POOL_SIZE)
+        # Alerts are delivered in order on one background thread so polling never waits on Slack
+        self._slack_executor = ThreadPoolExecutor(max_workers=1)
+        logger.info("Initializing CPXMonitor with base URL: %s", base_url)
         # Initialize servers immediately when creating the monitor
-        self.fetch_servers()
+        if refresh_servers or not self._load_cached_servers():
+            self.fetch_servers()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Release pooled connections and worker threads"""
+        self._executor.shutdown(wait=False)
+        # Let queued alerts go out before their session is closed
+        self._slack_executor.shutdown(wait=True)
+        self.session.close()
+        self.slack_session.close()
+        logger.info("CPXMonitor closed, cache stats: %s", self.cache_stats())
+
+    def _count_cache(self, cache: str, outcome: str):
+        with self._cache_counts_lock:
+            self._cache_counts[cache, outcome] += 1
+
+    def cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """Return hit/miss counts for the server list and per-server stats caches"""
+        with self._cache_counts_lock:
+            return {
+                cache: {outcome: self._cache_counts[cache, outcome] for outcome in ('hits', 'misses')}
+                for cache in ('servers', 'stats')
+            }
+
+    @staticmethod
+    def _create_session(pool_size: int) -> requests.Session:
+        """Build a pooled keep-alive session that retries failed connection attempts"""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            # No read retries: a host that accepts but never answers costs one timeout, not three
+            max_retries=Retry(total=2, read=0, backoff_factor=0.1)
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
 
     def fetch_servers(self) -> List[str]:
-        """Fetch all servers from CPX API"""
+        """Fetch all servers from CPX API, reusing the cached list within its TTL"""
+        if (self._servers_fetched_at is not None
+                and time.monotonic() - self._servers_fetched_at < SERVERS_CACHE_TTL):
+            self._count_cache('servers', 'hits')
+            return self.servers
+        self._count_cache('servers', 'misses')
         try:
-            logger.debug(f"Fetching servers from {self.base_url}/servers")
-            response = requests.get(f"{self.base_url}/servers", timeout=5)
+            logger.debug("Fetching servers from %s/servers", self.base_url)
+            response = self.session.get(f"{self.base_url}/servers", timeout=5)
             response.raise_for_status()
-            self.servers = response.json()
-            logger.info(f"Successfully fetched {len(self.servers)} servers")
+            self.servers = orjson.loads(response.content)
+            self._servers_fetched_at = time.monotonic()
+            logger.info("Successfully fetched %s servers", len(self.servers))
+            self._save_cached_servers()
             return self.servers
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error fetching servers: {e}")
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            if self.servers:
+                logger.warning("Error fetching servers, using cached list: %s", e)
+                return self.servers
+            logger.error("Error fetching servers: %s", e)
             return []
 
-    def fetch_server_stats(self, ip: str) -> Dict:
-        """Fetch stats for a specific server"""
+    def _load_cached_servers(self) -> bool:
+        """Adopt the on-disk server list if it belongs to this CPX API and is within its TTL"""
+        if not self.servers_cache_path:
+            return False
         try:
-            logger.debug(f"Fetching stats for server {ip}")
-            response = requests.get(f"{self.base_url}/{ip}", timeout=3)
-            response.raise_for_status()
-            stats = response.json()
-            stats['ip'] = ip
-            cpu = int(stats['cpu'][:-1])
-            memory = int(stats['memory'][:-1])
-            stats['status'] = 'Healthy' if cpu < 90 and memory < 90 else 'Unhealthy'
-            logger.debug(f"Stats for {ip}: CPU {cpu}%, Memory {memory}%, Status {stats['status']}")
-            return stats
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error fetching stats for {ip}: {e}")
+            age = time.time() - os.path.getmtime(self.servers_cache_path)
+            if not 0 <= age < SERVERS_CACHE_TTL:
+                return False
+            with open(self.servers_cache_path, 'rb') as f:
+                cached = orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.debug("Server cache %s not usable: %s", self.servers_cache_path, e)
+            return False
+        if not isinstance(cached, dict) or cached.get('base_url') != self.base_url:
+            return False
+        servers = cached.get('servers')
+        if not isinstance(servers, list) or not all(isinstance(ip, str) for ip in servers):
+            logger.debug("Server cache %s has no valid server list", self.servers_cache_path)
+            return False
+        self.servers = servers
+        self._servers_fetched_at = time.monotonic() - age
+        self._count_cache('servers', 'hits')
+        logger.info("Loaded %s servers from %s", len(self.servers), self.servers_cache_path)
+        return True
+
+    def _save_cached_servers(self):
+        """Write the server list to disk for later runs; failures only cost the next run a fetch"""
+        if not self.servers_cache_path:
+            return
+        try:
+            _write_atomic(self.servers_cache_path,
+                          orjson.dumps({'base_url': self.base_url, 'servers': self.servers}))
+        except OSError as e:
+            logger.warning("Could not write server cache %s: %s", self.servers_cache_path, e)
+
+    def _load_recent_alerts(self) -> Dict[Tuple[str, int], float]:
+        """Read alerts still inside ALERT_DEDUP_TTL from the on-disk history of this CPX API"""
+        if not self.alerts_cache_path:
             return {}
+        try:
+            with open(self.alerts_cache_path, 'rb') as f:
+                cached = orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.debug("Alert cache %s not usable: %s", self.alerts_cache_path, e)
+            return {}
+        if not isinstance(cached, dict) or cached.get('base_url') != self.base_url:
+            return {}
+        alerts = cached.get('alerts')
+        if not isinstance(alerts, list):
+            logger.debug("Alert cache %s has no valid alert list", self.alerts_cache_path)
+            return {}
+        now = time.time()
+        recent = {}
+        for entry in alerts:
+            if (isinstance(entry, list) and len(entry) == 3 and isinstance(entry[0], str)
+                    and isinstance(entry[1], int) and isinstance(entry[2], (int, float))
+                    and 0 <= now - entry[2] < ALERT_DEDUP_TTL):
+                recent[entry[0], entry[1]] = entry[2]
+        logger.debug("Loaded %s recent alerts from %s", len(recent), self.alerts_cache_path)
+        return recent
+
+    def _save_recent_alerts(self):
+        """Write unexpired alerts to disk for later runs; call with _recent_alerts_lock held"""
+        if not self.alerts_cache_path:
+            return
+        now = time.time()
+        alerts = [
+            [service, healthy, alerted_at]
+            for (service, healthy), alerted_at in self._recent_alerts.items()
+            if now - alerted_at < ALERT_DEDUP_TTL
+        ]
+        try:
+            _write_atomic(self.alerts_cache_path,
+                          orjson.dumps({'base_url': self.base_url, 'alerts': alerts}))
+        except OSError as e:
+            logger.warning("Could not write alert cache %s: %s", self.alerts_cache_path, e)
+
+    def _record_stats(self, ip: str, raw: Dict) -> ServerStat:
+        """Build a ServerStat from raw CPX stats and store it in the cache"""
+        # Parse the "NN%" strings once; views read the numeric fields
+        cpu = _pct(raw['cpu'])
+        memory = _pct(raw['memory'])
+        stats = ServerStat(
+            ip=ip,
+            service=raw['service'],
+            status=HEALTHY if cpu < 90 and memory < 90 else UNHEALTHY,
+            cpu=raw['cpu'],
+            memory=raw['memory'],
+            cpu_pct=cpu,
+            mem_pct=memory
+        )
+        logger.debug("Stats for %s: CPU %d%%, Memory %d%%, Status %s", ip, cpu, memory, stats.status)
+        self._stats_cache[ip] = (time.monotonic(), stats)
+        return stats
+
+    def _cached_stats(self, ip: str) -> Tuple[bool, Optional[ServerStat]]:
+        """Return (True, stats) if ip should not be polled now, else (False, None)
+
+        Stats within their TTL are served as they are. Servers in failure backoff are
+        skipped; their last stats are served while younger than the stale TTL.
+        """
+        cached = self._stats_cache.get(ip)
+        now = time.monotonic()
+        if cached and now - cached[0] < self.stats_ttl:
+            self._count_cache('stats', 'hits')
+            return True, cached[1]
+        if now < self._next_try.get(ip, 0):
+            logger.debug("Skipping %s in failure backoff", ip)
+            return True, cached[1] if cached and now - cached[0] < self._stale_ttl else None
+        self._count_cache('stats', 'misses')
+        return False, None
+
+    def _fetch_failed(self, ip: str, error) -> Optional[ServerStat]:
+        """Back off from a server whose fetch failed and return its stale stats if still usable"""
+        # Back off exponentially so a dead host does not cost a full timeout every refresh
+        failures = self._fail_counts[ip] = self._fail_counts.get(ip, 0) + 1
+        self._next_try[ip] = time.monotonic() + min(2 ** failures, FAILURE_BACKOFF_MAX)
+        cached = self._stats_cache.get(ip)
+        if cached and time.monotonic() - cached[0] < self._stale_ttl:
+            logger.warning("Error fetching stats for %s, using cached stats: %s", ip, error)
+            return cached[1]
+        logger.error("Error fetching stats for %s: %s", ip, error)
+        return None
+
+    def _fetch_succeeded(self, ip: str):
+        self._fail_counts.pop(ip, None)
+        self._next_try.pop(ip, None)
+
+    def fetch_server_stats(self, ip: str) -> Optional[ServerStat]:
+        """Fetch stats for a specific server, reusing cached stats within their TTL
+
+        Servers in failure backoff are not polled; their last stats are served while
+        younger than the stale TTL.
+        """
+        skip, stats = self._cached_stats(ip)
+        if skip:
+            return stats
+        try:
+            logger.debug("Fetching stats for server %s", ip)
+            response = self.session.get(f"{self.base_url}/{ip}", timeout=3)
+            response.raise_for_status()
+            stats = self._record_stats(ip, orjson.loads(response.content))
+        except (requests.exceptions.RequestException, KeyError, TypeError, ValueError) as e:
+            # Malformed stats (ValueError covers orjson.JSONDecodeError) count as a failed fetch
+            return self._fetch_failed(ip, e)
+        self._fetch_succeeded(ip)
+        return stats
+
+    def _fetch_stats(self, ips: Collection[str]) -> Dict[str, ServerStat]:
+        """Fetch stats for the given IPs concurrently, keyed by IP in input order; failed fetches are omitted"""
+        # map yields results in input order, so reports list servers the same way every run
+        return {stats.ip: stats for stats in self._executor.map(self.fetch_server_stats, ips) if stats}
+
+    def fetch_all_stats_batch(self) -> Optional[Dict[str, ServerStat]]:
+        """Fetch stats for every server in one batch request; None if the batch call failed
+
+        Like per-server fetches, servers with fresh cached stats or in failure backoff
+        are left out of the batch, and failed items fall back to stale cached stats.
+        """
+        # Every server gets a slot up front so the result keeps the server list order
+        server_stats: Dict[str, Optional[ServerStat]] = {}
+        pending = []
+        for ip in self.servers:
+            skip, server_stats[ip] = self._cached_stats(ip)
+            if not skip:
+                pending.append(ip)
+
+        if pending:
+            pipeline = [{"method": "GET", "path": f"/{ip}"} for ip in pending]
+            try:
+                logger.debug("Fetching stats for %s servers via batch request", len(pipeline))
+                response = self.session.post(f"{self.base_url}/batch-requests",
+                                             data=orjson.dumps({"pipeline": pipeline}),
+                                             headers=JSON_HEADERS, timeout=5)
+                if response.status_code in (404, 405, 501):
+                    logger.warning("CPX server does not support batch requests, using per-server fetches")
+                    self.use_batch = False
+                    return None
+                response.raise_for_status()
+                results = orjson.loads(response.content)
+            except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+                logger.error("Batch stats request failed: %s", e)
+                return None
+
+            if not isinstance(results, list) or len(results) != len(pending):
+                logger.error("Malformed batch stats response, using per-server fetches")
+                return None
+
+            for ip, result in zip(pending, results):
+                status = result.get('status') if isinstance(result, dict) else None
+                if status != 200:
+                    server_stats[ip] = self._fetch_failed(ip, f"batch status {status}")
+                    continue
+                try:
+                    server_stats[ip] = self._record_stats(ip, result['body'])
+                except (KeyError, TypeError, ValueError) as e:
+                    server_stats[ip] = self._fetch_failed(ip, repr(e))
+                    continue
+                self._fetch_succeeded(ip)
+        return {ip: stats for ip, stats in server_stats.items() if stats}
 
     def update_all_stats(self):
-        """Update stats for all servers"""
+        """Update stats for all servers, in one batch request if enabled, else concurrently"""
         logger.info("Updating stats for all servers")
-        self.server_stats = {}
-        for ip in self.servers:
-            stats = self.fetch_server_stats(ip)
-            if stats:
-                self.server_stats[ip] = stats
+        server_stats = self.fetch_all_stats_batch() if self.use_batch else None
+        if server_stats is None:
+            server_stats = self._fetch_stats(self.servers)
+        self.server_stats = server_stats
         self.last_update = datetime.now()
-        logger.info(f"Stats updated for {len(self.server_stats)}/{len(self.servers)} servers")
+        logger.info("Stats updated for %s/%s servers", len(self.server_stats), len(self.servers))
 
-    def send_slack_alert(self, services):
-        """Send alert to Slack via webhook - focused on unhealthy services"""
-        SLACK_WEBHOOK_URL = os.getenv('SLACK_WEBHOOK_URL')
-        if not SLACK_WEBHOOK_URL:
-            logger.error("SLACK_WEBHOOK_URL not found in environment variables")
-            return
-        
+    def _refresh_ips(self, ips: Set[str]):
+        """Refresh stats for a subset of servers, keeping the rest of the snapshot"""
+        fresh = self._fetch_stats(ips)
+        server_stats = {ip: stats for ip, stats in self.server_stats.items() if ip not in ips}
+        server_stats.update(fresh)
+        self.server_stats = server_stats
+        logger.debug("Stats refreshed for %s/%s tracked servers", len(fresh), len(ips))
+
+    @property
+    def snapshot(self) -> Snapshot:
+        """Aggregates of the current stats, built in a single pass and shared by all views"""
+        # server_stats is rebound on every refresh, so identity marks a new snapshot
+        server_stats = self.server_stats
+        if self._snapshot is not None and self._snapshot[0] is server_stats:
+            return self._snapshot[1]
+        cpu_total, memory_total, total, healthy = Counter(), Counter(), Counter(), Counter()
+        service_ips = defaultdict(list)
+        unhealthy = []
+        for stats in server_stats.values():
+            service = stats.service
+            service_ips[service].append(stats.ip)
+            cpu_total[service] += stats.cpu_pct
+            memory_total[service] += stats.mem_pct
+            total[service] += 1
+            if stats.status == HEALTHY:
+                healthy[service] += 1
+            else:
+                unhealthy.append(stats)
+        snapshot = Snapshot(
+            services={
+                service: {
+                    'healthy': healthy[service],
+                    'cpu': cpu_total[service],
+                    'memory': memory_total[service],
+                    'total': count
+                }
+                for service, count in total.items()
+            },
+            service_ips=dict(service_ips),
+            unhealthy=unhealthy,
+            underprovisioned={service for service in total if healthy[service] < 2}
+        )
+        self._snapshot = (server_stats, snapshot)
+        return snapshot
+
+    def _ensure_fresh(self):
+        """Refresh stats only if the current snapshot is missing or older than the TTL"""
+        if (self.last_update is None
+                or (datetime.now() - self.last_update).total_seconds() > self.stats_ttl):
+            self.update_all_stats()
+
+    def _build_alert_blocks(self, services: List[ServiceRow]) -> List[Dict]:
+        """Build Slack blocks for unhealthy instances, one compact section per service"""
         # Filter only unhealthy services
-        unhealthy_services = [s for s in services if s[2] == "Unhealthy"]
+        unhealthy_services = [s for s in services if s.status == UNHEALTHY]
         
         if not unhealthy_services:
             logger.info("No unhealthy services to alert")
-            return
+            return []
 
-        logger.warning(f"Preparing Slack alert for {len(unhealthy_services)} unhealthy services")
+        logger.warning("Preparing Slack alert for %s unhealthy services", len(unhealthy_services))
         
         # Group by service name
         service_groups = defaultdict(list)
         for service in unhealthy_services:
-            service_groups[service[0]].append(service)
-
-        # Build the alert message
-        alert_message = {
-            "text": "Critical Services Alert",
-            "blocks": [
-                {
-                    "type": "header",
-                    "text": {
-                        "type": "plain_text",
-                        "text": "Underprovisioned Unhealthy Services with less than 8 healthy instances",
-                        "emoji": True
-                    }
-                },
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": f"*Affected Services ({len(unhealthy_services)} instances):*"
-                    }
-                },
-                {
-                    "type": "divider"
-                }
-            ]
-        }
+            service_groups[service.service].append(service)
 
-        # Add each service group
-        for service_name, instances in service_groups.items():
-            alert_message["blocks"].append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"*{service_name}* ({len(instances)} unhealthy instances)"
-                }
-            })
-            
-            for instance in instances:
-                alert_message["blocks"].append({
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": (
-                            f"• *IP:* `{instance[1]}`\n"
-                            f"• *CPU:* `{instance[3]}`\n"
-                            f"• *Memory:* `{instance[4]}`"
-                        )
-                    }
-                })
-            
-            alert_message["blocks"].append({"type": "divider"})
+        # One pre-formatted table per service keeps the block count O(services)
+        return [
+            SLACK_ALERT_HEADER_BLOCK,
+            _mrkdwn_section(f"*Affected Services ({len(unhealthy_services)} instances):*"),
+            SLACK_DIVIDER_BLOCK,
+            *(section
+              for service_name, instances in service_groups.items()
+              for section in _service_alert_sections(service_name, instances)),
+            SLACK_DIVIDER_BLOCK
+        ]
 
-        try:
-            response = requests.post(
-                SLACK_WEBHOOK_URL,
-                json=alert_message,
-                headers={'Content-Type': 'application/json'},
-                timeout=5
-            )
-            response.raise_for_status()
-            logger.info("Slack alert for underprovisioned services sent successfully")
-        except Exception as e:
-            logger.error(f"Failed to send Slack alert: {e}")
-
-    def auto_remediate_services(self, services):
-        """Pretend to scale services with high CPU/Memory and send simplified Slack notification"""
-        SLACK_WEBHOOK_URL = os.getenv('SLACK_WEBHOOK_URL')
-        if not SLACK_WEBHOOK_URL:
-            logger.error("SLACK_WEBHOOK_URL not found in environment variables")
-            return
-            
-        services_to_scale = set()
-        
-        for service in services:
-            service_name = service[0]
-            cpu = int(service[3].rstrip('%'))
-            memory = int(service[4].rstrip('%'))
-            
-            # Check if CPU or memory is high
-            if cpu > 80 or memory > 80:
-                services_to_scale.add(service_name)
-                logger.warning(f"Service {service_name} marked for scaling (CPU: {cpu}%, Memory: {memory}%)")
+    def auto_remediate_services(self, services: List[ServiceRow]) -> List[Dict]:
+        """Pretend to scale services with high CPU/Memory and return the Slack blocks describing it"""
+        # Scale any service with an instance above 80% CPU or memory
+        services_to_scale = {row.service for row in services if row.cpu_pct > 80 or row.mem_pct > 80}
 
         if not services_to_scale:
             logger.info("No services require scaling")
+            return []
+
+        logger.warning("Preparing to auto-scale %s services: %s", len(services_to_scale), ', '.join(services_to_scale))
+
+        # Build the simplified scaling notification blocks, a bounded number of services per section
+        scaled = sorted(services_to_scale)
+        return [
+            SLACK_SCALING_HEADER_BLOCK,
+            SLACK_SCALING_INTRO_BLOCK,
+            *(_mrkdwn_section("\n".join(f"• *{service}*"
+                                        for service in scaled[start:start + SLACK_SECTION_SERVICES]))
+              for start in range(0, len(scaled), SLACK_SECTION_SERVICES)),
+            SLACK_SCALING_CONTEXT_BLOCK
+        ]
+
+    def _reserve_alerts(self, keys: Collection[Tuple[str, int]]) -> Set[Tuple[str, int]]:
+        """Claim the keys not alerted within ALERT_DEDUP_TTL and return them"""
+        now = time.time()
+        with self._recent_alerts_lock:
+            reserved = {
+                key for key in keys
+                if now - self._recent_alerts.get(key, float('-inf')) >= ALERT_DEDUP_TTL
+            }
+            for key in reserved:
+                self._recent_alerts[key] = now
+            if reserved:
+                self._save_recent_alerts()
+        return reserved
+
+    def _release_alerts(self, keys: Collection[Tuple[str, int]]):
+        """Drop reservations for alerts that were not delivered so they can be retried"""
+        with self._recent_alerts_lock:
+            for key in keys:
+                self._recent_alerts.pop(key, None)
+            if keys:
+                self._save_recent_alerts()
+
+    @staticmethod
+    def _split_slack_blocks(block_groups: List[List[Dict]]) -> List[List[Dict]]:
+        """Pack block groups, each led by its header block, into messages of SLACK_MAX_BLOCKS
+
+        A group that fits in one message is never split; a larger one continues in the
+        next message under a copy of its header. Every message starts with a header.
+        """
+        parts: List[List[Dict]] = []
+        part: List[Dict] = []
+        for header, *body in block_groups:
+            room = SLACK_MAX_BLOCKS - len(part)
+            if part and (room < 2 or (room < len(body) + 1 <= SLACK_MAX_BLOCKS)):
+                parts.append(part)
+                part = []
+            part.append(header)
+            for block in body:
+                if len(part) == SLACK_MAX_BLOCKS:
+                    parts.append(part)
+                    part = [header]
+                part.append(block)
+        parts.append(part)
+        if len(parts) > 1:
+            # Numbered copies of the leading header; the shared header constants stay untouched
+            for index, part in enumerate(parts, 1):
+                header = part[0]
+                part[0] = {**header, "text": {
+                    **header["text"], "text": f"{header['text']['text']} (part {index}/{len(parts)})"
+                }}
+        return parts
+
+    def _post_slack(self, block_groups: List[List[Dict]], alert_keys: Collection[Tuple[str, int]] = ()):
+        """Queue all non-empty block groups for delivery to Slack as one webhook message
+
+        Each group must start with its header block. Alerts over SLACK_MAX_BLOCKS are
+        split into numbered parts on group boundaries, sent in order.
+        alert_keys, reserved by the caller, are released unless every part is delivered.
+        """
+        block_groups = [group for group in block_groups if group]
+        if not block_groups or not SLACK_WEBHOOK_URL:
+            # A missing webhook was already reported once at startup
+            self._release_alerts(alert_keys)
             return
 
-        logger.warning(f"Preparing to auto-scale {len(services_to_scale)} services: {', '.join(services_to_scale)}")
-
-        # Build the simplified scaling notification message
-        scaling_message = {
-            "text": "Auto-scaling Actions Taken",
-            "blocks": [
-                {
-                    "type": "header",
-                    "text": {
-                        "type": "plain_text",
-                        "text": "Auto-scaling Initiated",
-                        "emoji": True
-                    }
-                },
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": "The following services were scaled based on CPU/Memory usage:"
-                    }
-                },
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": "\n".join([f"• *{service}*" for service in services_to_scale])
-                    }
-                },
-                {
-                    "type": "context",
-                    "elements": [
-                        {
-                            "type": "mrkdwn",
-                            "text": "Trigger: CPU or Memory > 80%"
-                        }
-                    ]
-                }
-            ]
-        }
+        chunks = self._split_slack_blocks(block_groups)
+        payloads = []
+        for part, chunk in enumerate(chunks, 1):
+            text = "Critical Services Alert"
+            if len(chunks) > 1:
+                text = f"{text} ({part}/{len(chunks)})"
+            payloads.append(orjson.dumps({"text": text, "blocks": chunk}))
+        self._slack_executor.submit(self._send_slack, payloads, alert_keys)
 
-        try:
-            response = requests.post(
-                SLACK_WEBHOOK_URL,
-                json=scaling_message,
-                headers={'Content-Type': 'application/json'},
-                timeout=5
-            )
-            response.raise_for_status()
-            logger.info("Auto-scaling notification sent to Slack successfully")
-        except Exception as e:
-            logger.error(f"Failed to send scaling notification to Slack: {e}")
+    def _send_slack(self, payloads: List[bytes], alert_keys: Collection[Tuple[str, int]]):
+        """POST the encoded parts of one alert in order; runs on the Slack worker thread
+
+        Stops at the first failed part and releases alert_keys so the alert is retried.
+        """
+        for part, payload in enumerate(payloads, 1):
+            try:
+                response = self.slack_session.post(
+                    SLACK_WEBHOOK_URL,
+                    data=payload,
+                    headers=JSON_HEADERS,
+                    timeout=5
+                )
+                response.raise_for_status()
+            except Exception as e:
+                logger.error("Failed to send Slack alert (part %d/%d): %s", part, len(payloads), e)
+                self._release_alerts(alert_keys)
+                return
+        logger.info("Slack alert for underprovisioned services sent successfully")
 
     def print_services_table(self):
         """Print all services in table format using tabulate"""
+        from tabulate import tabulate
+
         if not self.servers:
             logger.error("No servers found - please check CPX server connection")
             return
-        self.update_all_stats()
+        self._ensure_fresh()
 
-        # Prepare data for tabulate
-        table_data = []
-        for ip, stats in self.server_stats.items():
-            table_data.append([
-                ip,
-                stats['service'],
-                stats['status'],
-                stats['cpu'],
-                stats['memory']
-            ])
+        # Stream row tuples straight into tabulate
+        row = attrgetter('ip', 'service', 'status', 'cpu', 'memory')
+        table_data = (row(stats) for stats in self.server_stats.values())
 
         headers = ["IP", "Service", "Status", "CPU", "Memory"]
         logger.info("Displaying services table")
@@ -404,32 +870,21 @@ class CPXMonitor:
 
     def show_service_averages(self):
         """Print average CPU/Memory using tabulate"""
+        from tabulate import tabulate
+
         if not self.servers:
             logger.error("No servers found - please check CPX server connection")
             return
             
-        self.update_all_stats()
-
-        service_data = defaultdict(lambda: {'cpu_total': 0, 'memory_total': 0, 'count': 0})
-        
-        for stats in self.server_stats.values():
-            service = stats['service']
-            cpu = int(stats['cpu'][:-1])
-            memory = int(stats['memory'][:-1])
-            
-            service_data[service]['cpu_total'] += cpu
-            service_data[service]['memory_total'] += memory
-            service_data[service]['count'] += 1
+        self._ensure_fresh()
 
         # Prepare data for tabulate
         table_data = []
-        for service, data in service_data.items():
-            avg_cpu = data['cpu_total'] / data['count']
-            avg_memory = data['memory_total'] / data['count']
+        for service, data in self.snapshot.services.items():
             table_data.append([
                 service,
-                f"{avg_cpu:.1f}%",
-                f"{avg_memory:.1f}%"
+                f"{data['cpu'] / data['total']:.1f}%",
+                f"{data['memory'] / data['total']:.1f}%"
             ])
 
         headers = ["Service", "Avg CPU", "Avg Memory"]
@@ -439,99 +894,160 @@ class CPXMonitor:
 
     def flag_underprovisioned_services(self):
         """Flag services with fewer than 2 healthy instances using tabulate"""
+        from tabulate import tabulate
+
         if not self.servers:
             logger.error("No servers found - please check CPX server connection")
             return
             
-        self.update_all_stats()
+        self._ensure_fresh()
 
-        healthy_counts = defaultdict(int)
-        service_instances = defaultdict(list)
-        
-        for stats in self.server_stats.values():
-            service = stats['service']
-            if stats['status'] == 'Healthy':
-                healthy_counts[service] += 1
-            service_instances[service].append(stats)
+        snapshot = self.snapshot
+        underprovisioned = snapshot.underprovisioned
 
-        # Prepare data for tabulate
-        table_data = []
-        for service, count in healthy_counts.items():
-            if count < 2:
-                instances = service_instances[service]
-                for instance in instances:
-                    table_data.append([
-                        service,
-                        instance['ip'],
-                        instance['status'],
-                        instance['cpu'],
-                        instance['memory'],
-                        f"Only {count} healthy" if count < 2 else "OK"
-                    ])
+        # Prepare data for tabulate, only for instances of underprovisioned services
+        table_data = [
+            ServiceRow(
+                stats.service,
+                stats.ip,
+                stats.status,
+                stats.cpu,
+                stats.memory,
+                f"Only {snapshot.services[stats.service]['healthy']} healthy",
+                stats.cpu_pct,
+                stats.mem_pct
+            )
+            for stats in self.server_stats.values()
+            if stats.service in underprovisioned
+        ]
 
         if table_data:
             headers = ["Service", "IP", "Status", "CPU", "Memory", "Health Status"]
-            logger.warning(f"Found {len(table_data)} underprovisioned service instances")
+            logger.warning("Found %s underprovisioned service instances", len(table_data))
             print("\n Underprovisioned Services (fewer than 2 healthy instances):")
-            print(tabulate(table_data, headers=headers, tablefmt="grid"))
-            self.send_slack_alert(table_data)
-            # Auto-remediation for high CPU/Memory
-            self.auto_remediate_services(table_data)
+            # Trailing numeric columns are for remediation only, not display
+            print(tabulate([row[:6] for row in table_data], headers=headers, tablefmt="grid"))
+            if not SLACK_WEBHOOK_URL:
+                # A missing webhook was already reported once at startup; nothing to dedup
+                return
+            # Alert and auto-remediation for high CPU/Memory go out as one Slack message,
+            # skipping services already alerted on at the same health level
+            alert_keys = self._reserve_alerts(
+                {(svc, snapshot.services[svc]['healthy']) for svc in underprovisioned}
+            )
+            if not alert_keys:
+                logger.info("All underprovisioned services were alerted recently, skipping Slack")
+                return
+            alert_services = {svc for svc, _ in alert_keys}
+            alert_rows = [row for row in table_data if row.service in alert_services]
+            self._post_slack([
+                self._build_alert_blocks(alert_rows),
+                self.auto_remediate_services(alert_rows)
+            ], alert_keys=alert_keys)
         else:
             logger.info("All services have sufficient healthy instances")
             print("\n All services have at least 2 healthy instances")
 
     def track_service(self, service_name: str):
-        """Monitor a specific service over time with tabulate"""
+        """Monitor a specific service over time with a fixed-width table"""
         if not self.servers:
             logger.error("No servers found - please check CPX server connection")
             return
             
-        logger.info(f"Starting to track service {service_name}")
+        logger.info("Starting to track service %s", service_name)
         print(f"\n Monitoring {service_name} (press Ctrl+C to stop)...\n")
         
-        def signal_handler(sig, frame):
-            logger.info(f"Stopped tracking service {service_name}")
-            print("\n Monitoring stopped")
-            sys.exit(0)
-        
-        signal.signal(signal.SIGINT, signal_handler)
+        # Column widths are bounded (timestamp, IPv4, longest status, "100%"),
+        # so the row format is built once instead of re-measured every refresh
+        headers = ["Timestamp", "IP", "Status", "CPU", "Memory"]
+        widths = [
+            max(len(header), len(widest))
+            for header, widest in zip(headers, ["0000-00-00 00:00:00", "255.255.255.255",
+                                                UNHEALTHY, "100%", "100%"])
+        ]
+        row_format = "  ".join(f"{{:<{width}}}" for width in widths)
+        header_line = row_format.format(*headers)
+        separator = "-" * len(header_line)
 
+        tracked_ips = None
+        last_full_refresh = 0.0
+        interval = TRACK_MIN_INTERVAL
+        previous_snapshot = None
+        last_output = 0.0
         try:
             while True:
-                self.update_all_stats()
-                service_instances = [stats for stats in self.server_stats.values() 
-                                   if stats['service'] == service_name]
+                # Periodic full scan picks up newly spawned instances; timed rather than
+                # counted so it keeps its cadence when polling backs off
+                if (tracked_ips is None
+                        or time.monotonic() - last_full_refresh >= TRACK_FULL_REFRESH_INTERVAL):
+                    self.fetch_servers()
+                    self.update_all_stats()
+                    # Rows print in snapshot order; the set is only for membership tests
+                    tracked_ips = self.snapshot.service_ips.get(service_name, [])
+                    tracked_set = set(tracked_ips)
+                    last_full_refresh = time.monotonic()
+                else:
+                    self._refresh_ips(tracked_set)
+                service_instances = [self.server_stats[ip] for ip in tracked_ips
+                                     if ip in self.server_stats]
                 
                 if not service_instances:
-                    logger.error(f"No instances found for service: {service_name}")
+                    logger.error("No instances found for service: %s", service_name)
                     break
                 
-                # Prepare data for tabulate
-                table_data = []
-                for stats in service_instances:
-                    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    table_data.append([
-                        timestamp,
-                        stats['ip'],
-                        stats['status'],
-                        stats['cpu'],
-                        stats['memory']
-                    ])
-
-                headers = ["Timestamp", "IP", "Status", "CPU", "Memory"]
-                logger.debug(f"Current status for {service_name}: {len(service_instances)} instances")
-                print(tabulate(table_data, headers=headers, tablefmt="grid"))
-                print()  # Add space between updates
-                
-                time.sleep(5)
+                logger.debug("Current status for %s: %s instances", service_name, len(service_instances))
+                # All rows of one refresh share a single timestamp
+                timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+                snapshot = frozenset(
+                    (stats.ip, stats.status, stats.cpu, stats.memory)
+                    for stats in service_instances
+                )
+                now = time.monotonic()
+                if snapshot == previous_snapshot:
+                    # Nothing to redraw; back off and only show the loop is still alive
+                    interval = min(interval * TRACK_BACKOFF, TRACK_MAX_INTERVAL)
+                    if now - last_output >= TRACK_HEARTBEAT_INTERVAL:
+                        print(f"{timestamp}  No change ({len(service_instances)} instances)")
+                        last_output = now
+                else:
+                    # Poll quickly while the service is changing
+                    interval = TRACK_MIN_INTERVAL
+                    print(header_line)
+                    print(separator)
+                    print("\n".join(
+                        row_format.format(timestamp, stats.ip, stats.status, stats.cpu, stats.memory)
+                        for stats in service_instances
+                    ))
+                    print()  # Add space between updates
+                    last_output = now
+                previous_snapshot = snapshot
+
+                time.sleep(interval)
         except KeyboardInterrupt:
-            logger.info(f"Stopped tracking service {service_name} by user request")
+            logger.info("Stopped tracking service %s by user request", service_name)
             print("\n Monitoring stopped")
 
+def _positive_int(value: str) -> int:
+    """argparse type for options that must be an integer of at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
 def main():
     parser = argparse.ArgumentParser(description="CPX Monitoring Tool")
     parser.add_argument("--port", type=int, default=5008, help="Port of CPX server")
+    parser.add_argument("--workers", type=_positive_int, default=MAX_FETCH_WORKERS,
+                        help="Maximum number of concurrent stat requests")
+    parser.add_argument("--batch", action="store_true",
+                        help="Fetch all stats with one /batch-requests call if the CPX server supports it")
+    parser.add_argument("--stale-ok", type=float, default=STATS_CACHE_TTL, metavar="SECONDS",
+                        help="Reuse fetched stats for up to this many seconds before polling again")
+    parser.add_argument("--refresh", action="store_true",
+                        help="Ignore the cached server list and fetch it from CPX")
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     # Command 1: List services
@@ -552,25 +1068,27 @@ def main():
 
     args = parser.parse_args()
 
-    logger.info(f"Starting CPXMonitor with command: {args.command}")
-    monitor = CPXMonitor(f"http://localhost:{args.port}")
-
-    if args.command == "list":
-        monitor.print_services_table()
-    elif args.command == "averages":
-        monitor.show_service_averages()
-    elif args.command == "flag":
-        monitor.flag_underprovisioned_services()
-    elif args.command == "dashboard":
-        # Clear terminal and start dashboard
-        os.system('cls' if os.name == 'nt' else 'clear')
-        TerminalDashboard(monitor).start_live_view()
-    elif args.command == "track":
-        if not args.service:
-            logger.error("Service name not provided for track command")
-            print("Error: --service argument is required for track command")
-            sys.exit(1)
-        monitor.track_service(args.service)
+    logger.info("Starting CPXMonitor with command: %s", args.command)
+    with CPXMonitor(f"http://localhost:{args.port}", max_workers=args.workers,
+                    use_batch=args.batch, stats_ttl=args.stale_ok,
+                    servers_cache_path=SERVERS_CACHE_FILE, refresh_servers=args.refresh,
+                    alerts_cache_path=ALERTS_CACHE_FILE) as monitor:
+        if args.command == "list":
+            monitor.print_services_table()
+        elif args.command == "averages":
+            monitor.show_service_averages()
+        elif args.command == "flag":
+            monitor.flag_underprovisioned_services()
+        elif args.command == "dashboard":
+            # Clear terminal and start dashboard
+            os.system('cls' if os.name == 'nt' else 'clear')
+            TerminalDashboard(monitor).start_live_view()
+        elif args.command == "track":
+            if not args.service:
+                logger.error("Service name not provided for track command")
+                print("Error: --service argument is required for track command")
+                sys.exit(1)
+            monitor.track_service(args.service)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,9 +1,26 @@
 #!/usr/bin/env python3
 
+import argparse
 import unittest
 from unittest.mock import patch, MagicMock
-from monitor_cpx import CPXMonitor
+from monitor_cpx import CPXMonitor, ServerStat, ServiceRow, _pct, _positive_int
+import orjson
+import os
 import requests
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+def make_stat(ip, service, cpu, memory):
+    """Build a ServerStat the way fetch_server_stats would"""
+    status = 'Healthy' if cpu < 90 and memory < 90 else 'Unhealthy'
+    return ServerStat(ip=ip, service=service, status=status, cpu=f"{cpu}%",
+                      memory=f"{memory}%", cpu_pct=cpu, mem_pct=memory)
+
+def wait_for_slack(monitor):
+    """Block until alerts queued on the single Slack worker have been sent"""
+    monitor._slack_executor.submit(lambda: None).result()
 
 class TestCPXMonitor(unittest.TestCase):
     def setUp(self):
@@ -11,30 +28,35 @@ class TestCPXMonitor(unittest.TestCase):
         with patch.object(CPXMonitor, 'fetch_servers', return_value=[]):
             self.monitor = CPXMonitor("http://localhost:5008")
 
-    @patch('requests.get')
+    def tearDown(self):
+        self.monitor.close()
+
+    @patch('requests.Session.get')
     def test_fetch_servers(self, mock_get):
         mock_response = MagicMock()
-        mock_response.json.return_value = ["10.58.1.1", "10.58.1.2"]
+        mock_response.content = orjson.dumps(["10.58.1.1", "10.58.1.2"])
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
         servers = self.monitor.fetch_servers()
         self.assertEqual(servers, ["10.58.1.1", "10.58.1.2"])
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_fetch_server_stats(self, mock_get):
         mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "cpu": "50%",
             "memory": "30%",
             "service": "AuthService"
-        }
+        })
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
         stats = self.monitor.fetch_server_stats("10.58.1.1")
-        self.assertEqual(stats["service"], "AuthService")
-        self.assertEqual(stats["status"], "Healthy")
+        self.assertEqual(stats.service, "AuthService")
+        self.assertEqual(stats.status, "Healthy")
+        self.assertEqual(stats.cpu_pct, 50)
+        self.assertEqual(stats.mem_pct, 30)
 
     def test_update_all_stats(self):
         # Setup mock return values directly on the instance
@@ -43,20 +65,8 @@ class TestCPXMonitor(unittest.TestCase):
         # Mock the fetch_server_stats method
         with patch.object(self.monitor, 'fetch_server_stats') as mock_fetch_stats:
             mock_fetch_stats.side_effect = [
-                {  # First call
-                    "ip": "10.58.1.1",
-                    "cpu": "50%",
-                    "memory": "30%",
-                    "service": "AuthService",
-                    "status": "Healthy"
-                },
-                {  # Second call
-                    "ip": "10.58.1.2",
-                    "cpu": "60%",
-                    "memory": "40%",
-                    "service": "UserService",
-                    "status": "Healthy"
-                }
+                make_stat("10.58.1.1", "AuthService", 50, 30),  # First call
+                make_stat("10.58.1.2", "UserService", 60, 40)   # Second call
             ]
 
             # Execute the test
@@ -64,20 +74,521 @@ class TestCPXMonitor(unittest.TestCase):
             
             # Verify results
             self.assertEqual(len(self.monitor.server_stats), 2)
-            self.assertEqual(self.monitor.server_stats["10.58.1.1"]["service"], "AuthService")
-            self.assertEqual(self.monitor.server_stats["10.58.1.2"]["service"], "UserService")
+            self.assertEqual(self.monitor.server_stats["10.58.1.1"].service, "AuthService")
+            self.assertEqual(self.monitor.server_stats["10.58.1.2"].service, "UserService")
         
-    @patch('requests.get')
+    def test_reporting_reuses_fresh_snapshot(self):
+        self.monitor.servers = ["10.58.1.1"]
+        with patch.object(self.monitor, 'update_all_stats',
+                          wraps=self.monitor.update_all_stats) as mock_update, \
+                patch.object(self.monitor, 'fetch_server_stats', return_value=None):
+            self.monitor.print_services_table()
+            self.monitor.show_service_averages()
+            self.assertEqual(mock_update.call_count, 1)
+
+    @patch('builtins.print')
+    def test_print_services_table(self, mock_print):
+        self.monitor.servers = ["10.58.1.1"]
+        self.monitor.server_stats = {"10.58.1.1": make_stat("10.58.1.1", "AuthService", 95, 30)}
+        self.monitor.last_update = datetime.now()
+        self.monitor.print_services_table()
+        table = mock_print.call_args.args[0]
+        self.assertIn("10.58.1.1", table)
+        self.assertIn("Unhealthy", table)
+
+    @patch('builtins.print')
+    def test_print_services_table_keeps_server_order(self, mock_print):
+        self.monitor.servers = [f"10.58.1.{i}" for i in range(8)]
+        delays = {ip: 0.01 * (8 - i) for i, ip in enumerate(self.monitor.servers)}
+
+        def slow_fetch(ip):
+            # Later servers answer first
+            time.sleep(delays[ip])
+            return make_stat(ip, "AuthService", 50, 30)
+
+        with patch.object(self.monitor, 'fetch_server_stats', side_effect=slow_fetch):
+            self.monitor.print_services_table()
+        table = mock_print.call_args.args[0]
+        positions = [table.index(f"{ip} ") for ip in self.monitor.servers]
+        self.assertEqual(positions, sorted(positions))
+
+    @patch('monitor_cpx.SLACK_WEBHOOK_URL', 'https://hooks.slack.test/x')
+    @patch('requests.Session.post')
+    def test_flag_sends_single_slack_message(self, mock_post):
+        self.monitor.servers = ["10.58.1.1", "10.58.1.2"]
+        self.monitor.server_stats = {
+            "10.58.1.1": make_stat("10.58.1.1", "AuthService", 95, 30),
+            "10.58.1.2": make_stat("10.58.1.2", "AuthService", 20, 30)
+        }
+        self.monitor.last_update = datetime.now()
+        self.monitor.flag_underprovisioned_services()
+        wait_for_slack(self.monitor)
+        self.assertEqual(mock_post.call_count, 1)
+        blocks = orjson.loads(mock_post.call_args.kwargs['data'])['blocks']
+        self.assertIn("Auto-scaling Initiated", [b.get('text', {}).get('text') for b in blocks])
+        # Re-flagging the same instances within the dedup window does not re-post
+        self.monitor.flag_underprovisioned_services()
+        wait_for_slack(self.monitor)
+        self.assertEqual(mock_post.call_count, 1)
+
+    @patch('monitor_cpx.SLACK_WEBHOOK_URL', 'https://hooks.slack.test/x')
+    @patch('requests.Session.post')
+    def test_flag_only_alerts_newly_affected_services(self, mock_post):
+        self.monitor.servers = ["10.58.1.1"]
+        self.monitor.server_stats = {
+            "10.58.1.1": make_stat("10.58.1.1", "AuthService", 95, 30)
+        }
+        self.monitor.last_update = datetime.now()
+        self.monitor.flag_underprovisioned_services()
+        wait_for_slack(self.monitor)
+        self.monitor.servers = ["10.58.1.1", "10.58.1.2"]
+        self.monitor.server_stats = {
+            "10.58.1.1": make_stat("10.58.1.1", "AuthService", 95, 30),
+            "10.58.1.2": make_stat("10.58.1.2", "UserService", 95, 30)
+        }
+        self.monitor.flag_underprovisioned_services()
+        wait_for_slack(self.monitor)
+        self.assertEqual(mock_post.call_count, 2)
+        text = mock_post.call_args.kwargs['data'].decode()
+        self.assertIn("UserService", text)
+        self.assertNotIn("AuthService", text)
+
+    @patch('monitor_cpx.SLACK_WEBHOOK_URL', 'https://hooks.slack.test/x')
+    @patch('requests.Session.post')
+    def test_large_alert_split_into_slack_sized_messages(self, mock_post):
+        stats = {
+            f"10.58.1.{i}": make_stat(f"10.58.1.{i}", f"Service{i}", 95, 30)
+            for i in range(60)
+        }
+        self.monitor.servers = list(stats)
+        self.monitor.server_stats = stats
+        self.monitor.last_update = datetime.now()
+        self.monitor.flag_underprovisioned_services()
+        wait_for_slack(self.monitor)
+        self.assertEqual(mock_post.call_count, 2)
+        messages = [orjson.loads(call.kwargs['data']) for call in mock_post.call_args_list]
+        self.assertTrue(all(len(message['blocks']) <= 50 for message in messages))
+        self.assertEqual(messages[1]['text'], "Critical Services Alert (2/2)")
+        headers = [message['blocks'][0] for message in messages]
+        self.assertTrue(all(header['type'] == 'header' for header in headers))
+        self.assertTrue(headers[0]['text']['text'].endswith("(part 1/2)"))
+        self.assertTrue(headers[1]['text']['text'].startswith("Underprovisioned"))
+        self.assertTrue(headers[1]['text']['text'].endswith("(part 2/2)"))
+        # The auto-scaling group is kept whole, led by its own header
+        scaling = [block['type'] for block in messages[1]['blocks']][-5:]
+        self.assertEqual(scaling, ['header', 'section', 'section', 'section', 'context'])
+
+    def test_slack_split_starts_groups_in_a_fresh_part(self):
+        first = [{"type": "header", "text": {"type": "plain_text", "text": "A"}}] + [{"type": "divider"}] * 45
+        second = [{"type": "header", "text": {"type": "plain_text", "text": "B"}}] + [{"type": "divider"}] * 3
+        parts = CPXMonitor._split_slack_blocks([first, second])
+        self.assertEqual([len(part) for part in parts], [46, 4])
+        self.assertEqual(parts[1][0]['text']['text'], "B (part 2/2)")
+        # Shared header blocks are copied, not renamed in place
+        self.assertEqual(second[0]['text']['text'], "B")
+
+    @patch('monitor_cpx.SLACK_WEBHOOK_URL', 'https://hooks.slack.test/x')
+    def test_large_service_split_across_sections(self):
+        stats = {
+            f"10.58.{i // 250}.{i % 250}": make_stat(f"10.58.{i // 250}.{i % 250}", "MLService", 95, 30)
+            for i in range(200)
+        }
+        self.monitor.servers = list(stats)
+        self.monitor.server_stats = stats
+        self.monitor.last_update = datetime.now()
+        with patch.object(self.monitor, '_post_slack') as mock_post_slack:
+            self.monitor.flag_underprovisioned_services()
+        alert_blocks = mock_post_slack.call_args.args[0][0]
+        sections = [b['text']['text'] for b in alert_blocks if 'MLService' in b.get('text', {}).get('text', '')]
+        self.assertEqual(len(sections), 3)
+        self.assertTrue(all(len(text) <= 3000 for text in sections))
+        self.assertEqual(sum(text.count("95%") for text in sections), 200)
+
+    @patch('monitor_cpx.SLACK_WEBHOOK_URL', None)
+    def test_flag_without_webhook_skips_alert_cache(self):
+        self.monitor.servers = ["10.58.1.1"]
+        self.monitor.server_stats = {"10.58.1.1": make_stat("10.58.1.1", "AuthService", 95, 30)}
+        self.monitor.last_update = datetime.now()
+        with tempfile.TemporaryDirectory() as cache_dir:
+            self.monitor.alerts_cache_path = os.path.join(cache_dir, "alerts.json")
+            with patch.object(self.monitor, '_post_slack') as mock_post_slack:
+                self.monitor.flag_underprovisioned_services()
+            mock_post_slack.assert_not_called()
+            self.assertEqual(os.listdir(cache_dir), [])
+        self.assertEqual(self.monitor._recent_alerts, {})
+
+    def test_many_scaled_services_split_across_sections(self):
+        rows = [
+            ServiceRow(f"{'Scaling' * 5}Service{i}", f"10.58.1.{i}", "Unhealthy", "95%", "30%",
+                       "Only 0 healthy", 95, 30)
+            for i in range(200)
+        ]
+        blocks = self.monitor.auto_remediate_services(rows)
+        sections = [b['text']['text'] for b in blocks[2:-1]]
+        self.assertEqual(len(sections), 4)
+        self.assertTrue(all(len(text) <= 3000 for text in sections))
+        self.assertEqual(sum(text.count("•") for text in sections), 200)
+        self.assertEqual(blocks[-1]['type'], 'context')
+
+    @patch('monitor_cpx.SLACK_WEBHOOK_URL', 'https://hooks.slack.test/x')
+    @patch('requests.Session.post')
+    def test_flag_deduplicates_alerts_still_queued(self, mock_post):
+        self.monitor.servers = ["10.58.1.1"]
+        self.monitor.server_stats = {"10.58.1.1": make_stat("10.58.1.1", "AuthService", 95, 30)}
+        self.monitor.last_update = datetime.now()
+        # Hold the Slack worker so the first alert is still undelivered when re-flagging
+        release = threading.Event()
+        self.monitor._slack_executor.submit(release.wait)
+        self.monitor.flag_underprovisioned_services()
+        self.monitor.flag_underprovisioned_services()
+        release.set()
+        wait_for_slack(self.monitor)
+        self.assertEqual(mock_post.call_count, 1)
+
+    @patch('monitor_cpx.SLACK_WEBHOOK_URL', 'https://hooks.slack.test/x')
+    @patch('requests.Session.post')
+    def test_failed_alert_part_is_not_deduplicated(self, mock_post):
+        stats = {
+            f"10.58.1.{i}": make_stat(f"10.58.1.{i}", f"Service{i}", 95, 30)
+            for i in range(60)
+        }
+        self.monitor.servers = list(stats)
+        self.monitor.server_stats = stats
+        self.monitor.last_update = datetime.now()
+        mock_post.return_value.raise_for_status.side_effect = requests.exceptions.HTTPError()
+        self.monitor.flag_underprovisioned_services()
+        wait_for_slack(self.monitor)
+        # Remaining parts are not sent once one fails
+        self.assertEqual(mock_post.call_count, 1)
+        mock_post.return_value.raise_for_status.side_effect = None
+        self.monitor.flag_underprovisioned_services()
+        wait_for_slack(self.monitor)
+        self.assertEqual(mock_post.call_count, 3)
+
+    @patch('monitor_cpx.SLACK_WEBHOOK_URL', 'https://hooks.slack.test/x')
+    @patch('requests.Session.post')
+    def test_alert_dedup_shared_through_disk_cache(self, mock_post):
+        stats = {"10.58.1.1": make_stat("10.58.1.1", "AuthService", 95, 30)}
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache_path = os.path.join(cache_dir, "alerts.json")
+            for _ in range(2):
+                # Each scheduled flag run is a fresh process with its own monitor
+                with patch.object(CPXMonitor, 'fetch_servers', return_value=[]):
+                    monitor = CPXMonitor("http://localhost:5008", alerts_cache_path=cache_path)
+                with monitor:
+                    monitor.servers = list(stats)
+                    monitor.server_stats = stats
+                    monitor.last_update = datetime.now()
+                    monitor.flag_underprovisioned_services()
+            self.assertEqual(mock_post.call_count, 1)
+            # Writes go through private temp files that never linger
+            self.assertEqual(os.listdir(cache_dir), ["alerts.json"])
+            # Alerts for another CPX API are not suppressed
+            with patch.object(CPXMonitor, 'fetch_servers', return_value=[]):
+                with CPXMonitor("http://localhost:5009", alerts_cache_path=cache_path) as other:
+                    self.assertEqual(other._recent_alerts, {})
+
+    @patch('monitor_cpx.SLACK_WEBHOOK_URL', 'https://hooks.slack.test/x')
+    def test_flag_includes_services_without_healthy_instances(self):
+        self.monitor.servers = ["10.58.1.1"]
+        self.monitor.server_stats = {
+            "10.58.1.1": make_stat("10.58.1.1", "MLService", 95, 95)
+        }
+        self.monitor.last_update = datetime.now()
+        with patch.object(self.monitor, '_post_slack') as mock_post_slack:
+            self.monitor.flag_underprovisioned_services()
+        alert_blocks = mock_post_slack.call_args.args[0][0]
+        self.assertIn("MLService", "".join(b.get('text', {}).get('text', '') for b in alert_blocks))
+
+    @patch('builtins.print')
+    @patch('time.sleep', side_effect=[None, None, KeyboardInterrupt])
+    def test_track_service_skips_unchanged_refreshes(self, mock_sleep, mock_print):
+        self.monitor.servers = ["10.58.1.1"]
+        self.monitor.server_stats = {"10.58.1.1": make_stat("10.58.1.1", "AuthService", 50, 30)}
+        with patch.object(self.monitor, 'fetch_servers'), \
+                patch.object(self.monitor, 'update_all_stats'), \
+                patch.object(self.monitor, '_refresh_ips'):
+            self.monitor.track_service("AuthService")
+        printed = [call.args[0] for call in mock_print.call_args_list if call.args]
+        self.assertEqual(sum(line.startswith("Timestamp") for line in printed), 1)
+        # Backs off while stable
+        self.assertGreater(mock_sleep.call_args_list[1].args[0], mock_sleep.call_args_list[0].args[0])
+
+    @patch('builtins.print')
+    @patch('time.sleep', side_effect=[None, None, KeyboardInterrupt])
+    def test_track_service_full_refresh_is_time_based(self, mock_sleep, mock_print):
+        self.monitor.servers = ["10.58.1.1"]
+        self.monitor.server_stats = {"10.58.1.1": make_stat("10.58.1.1", "AuthService", 50, 30)}
+        with patch.object(self.monitor, 'fetch_servers'), \
+                patch.object(self.monitor, 'update_all_stats') as mock_update, \
+                patch.object(self.monitor, '_refresh_ips') as mock_refresh:
+            with patch('monitor_cpx.TRACK_FULL_REFRESH_INTERVAL', 0):
+                self.monitor.track_service("AuthService")
+            self.assertEqual(mock_update.call_count, 3)
+            mock_sleep.side_effect = [None, None, KeyboardInterrupt]
+            self.monitor.track_service("AuthService")
+            self.assertEqual(mock_update.call_count, 4)
+            self.assertEqual(mock_refresh.call_count, 2)
+
+    @patch('builtins.print')
+    @patch('time.sleep', side_effect=[None, KeyboardInterrupt])
+    def test_track_service_keeps_server_order(self, mock_sleep, mock_print):
+        ips = [f"10.58.1.{i}" for i in range(20)]
+        self.monitor.servers = ips
+        self.monitor.server_stats = {ip: make_stat(ip, "AuthService", 50, i) for i, ip in enumerate(ips)}
+        with patch.object(self.monitor, 'fetch_servers'), \
+                patch.object(self.monitor, 'update_all_stats'), \
+                patch.object(self.monitor, '_refresh_ips') as mock_refresh:
+            self.monitor.track_service("AuthService")
+        mock_refresh.assert_called_once_with(set(ips))
+        rows = "\n".join(call.args[0] for call in mock_print.call_args_list if call.args)
+        positions = [rows.index(f"{ip} ") for ip in ips]
+        self.assertEqual(positions, sorted(positions))
+
+    def test_refresh_ips_keeps_untracked_stats(self):
+        self.monitor.server_stats = {
+            "10.58.1.1": make_stat("10.58.1.1", "AuthService", 10, 10),
+            "10.58.1.2": make_stat("10.58.1.2", "UserService", 20, 20)
+        }
+        fresh = make_stat("10.58.1.1", "AuthService", 70, 10)
+        with patch.object(self.monitor, 'fetch_server_stats', return_value=fresh) as mock_fetch:
+            self.monitor._refresh_ips({"10.58.1.1"})
+        mock_fetch.assert_called_once_with("10.58.1.1")
+        self.assertEqual(self.monitor.server_stats["10.58.1.1"].cpu, "70%")
+        self.assertEqual(self.monitor.server_stats["10.58.1.2"].cpu, "20%")
+
+    @patch('requests.Session.post')
+    def test_batch_falls_back_when_unsupported(self, mock_post):
+        self.monitor.servers = ["10.58.1.1"]
+        self.monitor.use_batch = True
+        mock_post.return_value.status_code = 404
+        stats = make_stat("10.58.1.1", "AuthService", 50, 30)
+        with patch.object(self.monitor, 'fetch_server_stats', return_value=stats):
+            self.monitor.update_all_stats()
+        self.assertFalse(self.monitor.use_batch)
+        self.assertEqual(self.monitor.server_stats, {"10.58.1.1": stats})
+
+    @patch('requests.Session.post')
+    def test_batch_short_response_falls_back(self, mock_post):
+        self.monitor.servers = ["10.58.1.1", "10.58.1.2"]
+        self.monitor.use_batch = True
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.content = orjson.dumps([
+            {"status": 200, "body": {"cpu": "50%", "memory": "30%", "service": "AuthService"}}
+        ])
+        self.assertIsNone(self.monitor.fetch_all_stats_batch())
+
+    @patch('requests.Session.post')
+    def test_batch_malformed_items_are_skipped(self, mock_post):
+        self.monitor.servers = ["10.58.1.1", "10.58.1.2", "10.58.1.3", "10.58.1.4", "10.58.1.5"]
+        self.monitor.use_batch = True
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.content = orjson.dumps([
+            "not a dict",
+            {"status": 200, "body": {"cpu": "??", "memory": "30%"}},
+            {"status": 200, "body": {"cpu": "50%", "memory": "30%", "service": "AuthService"}},
+            {"status": 200, "body": {"cpu": "", "memory": "30%", "service": "AuthService"}},
+            {"status": 200, "body": ["not", "a", "dict"]}
+        ])
+        server_stats = self.monitor.fetch_all_stats_batch()
+        self.assertEqual(list(server_stats), ["10.58.1.3"])
+        # Failed items back off like failed per-server fetches
+        self.assertEqual(set(self.monitor._next_try), {"10.58.1.1", "10.58.1.2", "10.58.1.4", "10.58.1.5"})
+        # A non-list body is not a batch response at all
+        self.monitor._stats_cache.clear()
+        self.monitor._next_try.clear()
+        mock_post.return_value.content = orjson.dumps({"error": "oops"})
+        self.assertIsNone(self.monitor.fetch_all_stats_batch())
+
+    @patch('requests.Session.post')
+    def test_batch_honours_stats_cache_and_backoff(self, mock_post):
+        self.monitor.servers = ["10.58.1.1", "10.58.1.2", "10.58.1.3", "10.58.1.4"]
+        self.monitor.use_batch = True
+        fresh = make_stat("10.58.1.1", "AuthService", 50, 30)
+        backing_off = make_stat("10.58.1.2", "AuthService", 60, 30)
+        stale = make_stat("10.58.1.3", "AuthService", 70, 30)
+        now = time.monotonic()
+        self.monitor._stats_cache.update({
+            "10.58.1.1": (now, fresh),
+            "10.58.1.2": (now - 5, backing_off),
+            "10.58.1.3": (now - 5, stale)
+        })
+        self.monitor._next_try["10.58.1.2"] = now + 30
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.content = orjson.dumps([
+            {"status": 500, "body": {}},
+            {"status": 200, "body": {"cpu": "10%", "memory": "30%", "service": "UserService"}}
+        ])
+        server_stats = self.monitor.fetch_all_stats_batch()
+        pipeline = orjson.loads(mock_post.call_args.kwargs['data'])['pipeline']
+        self.assertEqual([item['path'] for item in pipeline], ["/10.58.1.3", "/10.58.1.4"])
+        self.assertEqual(list(server_stats), self.monitor.servers)
+        self.assertIs(server_stats["10.58.1.2"], backing_off)
+        # A failed item falls back to its stale stats and backs off
+        self.assertIs(server_stats["10.58.1.3"], stale)
+        self.assertIn("10.58.1.3", self.monitor._next_try)
+        # Nothing left to poll means no batch request at all
+        mock_post.reset_mock()
+        self.monitor._next_try.clear()
+        now = time.monotonic()
+        for ip, (_, stats) in list(self.monitor._stats_cache.items()):
+            self.monitor._stats_cache[ip] = (now, stats)
+        self.assertEqual(len(self.monitor.fetch_all_stats_batch()), 4)
+        mock_post.assert_not_called()
+
+    @patch('requests.Session.get')
+    def test_malformed_server_stats_are_skipped(self, mock_get):
+        self.monitor.servers = ["10.58.1.1", "10.58.1.2", "10.58.1.3", "10.58.1.4"]
+        bodies = {
+            "10.58.1.1": {"cpu": "", "memory": "30%", "service": "AuthService"},
+            "10.58.1.2": {"cpu": "50%", "memory": "30%"},
+            "10.58.1.3": ["not", "a", "dict"],
+            "10.58.1.4": {"cpu": "50%", "memory": "30%", "service": "AuthService"}
+        }
+
+        def respond(url, timeout):
+            response = MagicMock()
+            response.content = orjson.dumps(bodies[url.rsplit('/', 1)[1]])
+            return response
+
+        mock_get.side_effect = respond
+        self.monitor.update_all_stats()
+        self.assertEqual(list(self.monitor.server_stats), ["10.58.1.4"])
+        # Malformed servers back off like any other failed fetch
+        self.assertEqual(self.monitor._fail_counts, {"10.58.1.1": 1, "10.58.1.2": 1, "10.58.1.3": 1})
+
+    def test_snapshot(self):
+        unhealthy = make_stat("10.58.1.2", "AuthService", 95, 30)
+        self.monitor.server_stats = {
+            "10.58.1.1": make_stat("10.58.1.1", "AuthService", 40, 20),
+            "10.58.1.2": unhealthy
+        }
+        snapshot = self.monitor.snapshot
+        self.assertEqual(snapshot.services, {
+            "AuthService": {"healthy": 1, "cpu": 135, "memory": 50, "total": 2}
+        })
+        self.assertEqual(snapshot.service_ips, {"AuthService": ["10.58.1.1", "10.58.1.2"]})
+        self.assertEqual(snapshot.unhealthy, [unhealthy])
+        self.assertEqual(snapshot.underprovisioned, {"AuthService"})
+        # Same stats are served from the memo; a new refresh is recomputed
+        self.assertIs(self.monitor.snapshot, snapshot)
+        self.monitor.server_stats = {"10.58.1.3": make_stat("10.58.1.3", "UserService", 10, 10)}
+        self.assertEqual(list(self.monitor.snapshot.services), ["UserService"])
+
+    @patch('requests.Session.get')
     def test_empty_server_response(self, mock_get):
-        mock_get.return_value.json.return_value = []
+        mock_get.return_value.content = orjson.dumps([])
         servers = self.monitor.fetch_servers()
         self.assertEqual(servers, [])
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_server_stats_timeout(self, mock_get):
         mock_get.side_effect = requests.exceptions.Timeout()
         stats = self.monitor.fetch_server_stats("10.58.1.1")
-        self.assertEqual(stats, {})
+        self.assertIsNone(stats)
+
+    def test_session_does_not_retry_read_timeouts(self):
+        retries = self.monitor.session.get_adapter(self.monitor.base_url).max_retries
+        self.assertEqual(retries.read, 0)
+        self.assertEqual(retries.connect, None)
+        self.assertEqual(retries.total, 2)
+
+    @patch('requests.Session.get')
+    def test_failing_server_backs_off(self, mock_get):
+        mock_get.side_effect = requests.exceptions.Timeout()
+        self.assertEqual(self.monitor._fetch_stats(["10.58.1.1"]), {})
+        self.assertEqual(self.monitor._fetch_stats(["10.58.1.1"]), {})
+        # Second refresh skips the host instead of waiting on another timeout
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(self.monitor._fail_counts["10.58.1.1"], 1)
+
+    @patch('requests.Session.get')
+    def test_server_in_backoff_keeps_last_stats(self, mock_get):
+        cached = make_stat("10.58.1.1", "AuthService", 50, 30)
+        self.monitor._stats_cache["10.58.1.1"] = (time.monotonic() - 5, cached)
+        mock_get.side_effect = requests.exceptions.Timeout()
+        self.assertEqual(self.monitor._fetch_stats(["10.58.1.1"]), {"10.58.1.1": cached})
+        # Still served from the cache while the host is skipped
+        self.assertEqual(self.monitor._fetch_stats(["10.58.1.1"]), {"10.58.1.1": cached})
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch('requests.Session.get')
+    def test_server_stats_cached_within_ttl(self, mock_get):
+        mock_get.return_value.content = orjson.dumps({
+            "cpu": "50%",
+            "memory": "30%",
+            "service": "AuthService"
+        })
+        first = self.monitor.fetch_server_stats("10.58.1.1")
+        second = self.monitor.fetch_server_stats("10.58.1.1")
+        self.assertEqual(first, second)
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(self.monitor.cache_stats()['stats'], {'hits': 1, 'misses': 1})
+
+    @patch('requests.Session.get')
+    def test_server_stats_stale_fallback(self, mock_get):
+        cached = make_stat("10.58.1.1", "AuthService", 50, 30)
+        # Expired for normal reads but still young enough to serve on failure
+        self.monitor._stats_cache["10.58.1.1"] = (time.monotonic() - 5, cached)
+        mock_get.side_effect = requests.exceptions.ConnectionError()
+        stats = self.monitor.fetch_server_stats("10.58.1.1")
+        self.assertEqual(stats, cached)
+
+    @patch('requests.Session.get')
+    def test_stats_ttl_is_configurable(self, mock_get):
+        cached = make_stat("10.58.1.1", "AuthService", 50, 30)
+        self.monitor.stats_ttl = 10.0
+        self.monitor._stats_cache["10.58.1.1"] = (time.monotonic() - 5, cached)
+        stats = self.monitor.fetch_server_stats("10.58.1.1")
+        self.assertEqual(stats, cached)
+        mock_get.assert_not_called()
+
+    @patch('requests.Session.get')
+    def test_server_list_shared_through_disk_cache(self, mock_get):
+        mock_get.return_value.content = orjson.dumps(["10.58.1.1"])
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache_path = os.path.join(cache_dir, "servers.json")
+            with CPXMonitor("http://localhost:5008", servers_cache_path=cache_path) as first:
+                self.assertEqual(first.servers, ["10.58.1.1"])
+            with CPXMonitor("http://localhost:5008", servers_cache_path=cache_path) as second:
+                self.assertEqual(second.servers, ["10.58.1.1"])
+            self.assertEqual(mock_get.call_count, 1)
+            self.assertEqual(os.listdir(cache_dir), ["servers.json"])
+            # Another CPX API or an explicit refresh does not reuse the file
+            with CPXMonitor("http://localhost:5009", servers_cache_path=cache_path):
+                pass
+            with CPXMonitor("http://localhost:5008", servers_cache_path=cache_path,
+                            refresh_servers=True):
+                pass
+            self.assertEqual(mock_get.call_count, 3)
+
+    @patch('requests.Session.get')
+    def test_invalid_server_cache_is_ignored(self, mock_get):
+        mock_get.return_value.content = orjson.dumps(["10.58.1.1"])
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache_path = os.path.join(cache_dir, "servers.json")
+            for cached in ({"base_url": "http://localhost:5008"},
+                           {"base_url": "http://localhost:5008", "servers": "10.58.1.1"},
+                           {"base_url": "http://localhost:5008", "servers": [1, 2]}):
+                with open(cache_path, 'wb') as f:
+                    f.write(orjson.dumps(cached))
+                with CPXMonitor("http://localhost:5008", servers_cache_path=cache_path) as monitor:
+                    self.assertEqual(monitor.servers, ["10.58.1.1"])
+            self.assertEqual(mock_get.call_count, 3)
+
+    def test_positive_int_rejects_non_positive(self):
+        self.assertEqual(_positive_int("4"), 4)
+        for value in ("0", "-2", "x"):
+            with self.assertRaises(argparse.ArgumentTypeError):
+                _positive_int(value)
+
+    def test_pct_parsing(self):
+        self.assertEqual(_pct("42%"), 42)
+        self.assertEqual(_pct("100%"), 100)
+        self.assertEqual(_pct("7"), 7)
+        for value in ("", "%", "4x"):
+            with self.assertRaises(ValueError):
+                _pct(value)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file